@@ -14,6 +14,7 @@ complete before the first move begins.
 
 from __future__ import annotations
 
+import collections
 import os
 import stat
 import tomllib
@@ -21,7 +22,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StagedArchive:
     """One expected archive with its resolved staging locations.
 
@@ -62,7 +63,9 @@ def _validate_targets(staging_config: Path, targets: list[str]) -> None:
     if not targets:
         msg = f"{staging_config} defines no release targets"
         raise ValueError(msg)
-    duplicates = sorted({target for target in targets if targets.count(target) > 1})
+    duplicates = sorted(
+        target for target, count in collections.Counter(targets).items() if count > 1
+    )
     if duplicates:
         msg = f"{staging_config} defines duplicate release targets: " + ", ".join(
             duplicates
@@ -139,74 +142,116 @@ def _is_file(path: Path) -> bool:
         return False
 
 
-def _exists_any(path: Path) -> bool:
-    """Report whether any filesystem entry occupies ``path``.
-
-    The probe uses ``lstat`` so symlinks — including dangling ones — count
-    as occupying the destination, and directories, sockets, FIFOs, and
-    device nodes are all treated the same as regular files.
+def _is_directory(entry: os.DirEntry[str]) -> bool:
+    """Classify a directory entry the way ``os.walk`` does.
 
     Parameters
     ----------
-    path
-        Destination path to probe.
+    entry
+        Entry produced by ``os.scandir``.
 
     Returns
     -------
     bool
-        ``True`` when any entry exists at ``path``; ``False`` when absent.
+        ``True`` when the entry, following symlinks, is a directory; an entry
+        whose type cannot be determined is treated as a non-directory.
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
 
-    Raises
-    ------
-    OSError
-        For any probe failure other than the path being absent.
+
+def _is_symlink(entry: os.DirEntry[str]) -> bool:
+    """Classify a directory entry as a symlink the way ``os.walk`` does.
+
+    Parameters
+    ----------
+    entry
+        Entry produced by ``os.scandir``.
+
+    Returns
+    -------
+    bool
+        ``True`` when the entry itself is a symlink; an entry whose type
+        cannot be determined is treated as a non-symlink.
     """
     try:
-        path.lstat()
-    except FileNotFoundError:
+        return entry.is_symlink()
+    except OSError:
         return False
-    return True
 
 
-def _walk_files(root: Path) -> list[Path]:
-    """Collect every file below ``root``, propagating traversal errors.
+def _walk_candidates(
+    root: Path, names: frozenset[str]
+) -> tuple[dict[str, list[os.DirEntry[str]]], frozenset[str]]:
+    """Index the nested entries below ``root`` that carry an expected name.
+
+    ``os.scandir`` reports each entry's type from the directory read itself,
+    so the walk classifies entries without a ``stat`` per file, and the
+    indexed entries keep that type for :func:`_resolve_archive` to reuse.
+    Entries directly in ``root`` are not indexed: anything there has
+    already been hoisted and is handled as a destination collision instead,
+    so the walk records every name read from ``root`` for
+    :func:`_destination_collisions` rather than probing each destination.
+    As with ``os.walk``, symlinked directories are listed but never entered.
 
     ``Path.rglob`` suppresses errors such as ``PermissionError`` during
     traversal, which would let an unreadable directory masquerade as a
-    missing asset; ``os.walk`` with an error callback surfaces them instead.
+    missing asset; reading each directory with ``os.scandir`` directly
+    surfaces them instead.
 
     Parameters
     ----------
     root
         Directory to walk recursively.
+    names
+        Expected archive file names worth indexing.
 
     Returns
     -------
-    list[Path]
-        Every directory entry found below ``root``.
+    tuple[dict[str, list[os.DirEntry[str]]], frozenset[str]]
+        Every non-directory entry below ``root``'s own level whose name is
+        in ``names``, keyed by that name, and the name of every entry of any
+        type — dangling symlinks included — directly in ``root``.
 
     Raises
     ------
     OSError
         If any directory in the tree cannot be read.
     """
-
-    def _raise(error: OSError) -> None:
-        raise error
-
-    files: list[Path] = []
-    for directory, _subdirs, names in os.walk(root, onerror=_raise):
-        files.extend(Path(directory) / name for name in names)
-    return files
-
-
-def _destination_collisions(dist_dir: Path, names: tuple[str, ...]) -> list[str]:
+    top = os.fspath(root)
+    staged: dict[str, list[os.DirEntry[str]]] = {}
+    occupied: set[str] = set()
+    pending = [top]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if directory == top:
+                    occupied.add(entry.name)
+                if _is_directory(entry):
+                    if not _is_symlink(entry):
+                        pending.append(entry.path)
+                elif directory != top and entry.name in names:
+                    staged.setdefault(entry.name, []).append(entry)
+    return staged, frozenset(occupied)
+
+
+def _destination_collisions(
+    occupied: frozenset[str], names: tuple[str, ...]
+) -> list[str]:
     """Report which of ``names`` is already occupied at the dist root.
 
+    Any entry counts as occupying a destination: symlinks (including dangling
+    ones), directories, sockets, FIFOs, and device nodes are all treated the
+    same as regular files.
+
     Parameters
     ----------
-    dist_dir
-        Release staging root the pair would be moved into.
+    occupied
+        Names of every entry directly in the dist root, as recorded by
+        :func:`_walk_candidates`.
     names
         Bare file names whose destinations must be free.
 
@@ -214,17 +259,12 @@ def _destination_collisions(dist_dir: Path, names: tuple[str, ...]) -> list[str]
     -------
     list[str]
         The occupied names, in the order given; empty when both are free.
-
-    Raises
-    ------
-    OSError
-        If a destination cannot be probed.
     """
-    return [name for name in names if _exists_any(dist_dir / name)]
+    return [name for name in names if name in occupied]
 
 
 def _resolve_archive(
-    dist_dir: Path, staged: list[Path], name: str
+    staged: dict[str, list[os.DirEntry[str]]], occupied: frozenset[str], name: str
 ) -> StagedArchive | str:
     """Resolve one expected archive, or describe why it cannot be staged.
 
@@ -234,10 +274,14 @@ def _resolve_archive(
 
     Parameters
     ----------
-    dist_dir
-        Release staging root; destinations are probed directly below it.
     staged
-        Every file found below the dist root, excluding the root itself.
+        Entries found below the dist root, excluding the root itself, keyed
+        by file name as returned by :func:`_walk_candidates`. Their file type
+        was recorded by the walk, so the archive itself is not probed again;
+        like :func:`_is_file`, the check does not follow symlinks.
+    occupied
+        Names of every entry directly in the dist root, against which the
+        pair's destinations are checked.
     name
         Expected archive file name to resolve.
 
@@ -249,18 +293,19 @@ def _resolve_archive(
     Raises
     ------
     OSError
-        If an asset or destination cannot be probed.
+        If the checksum sidecar cannot be probed.
     """
-    matches = [path for path in staged if path.name == name]
+    matches = staged.get(name, [])
     if len(matches) != 1:
         return f"{name} (found {len(matches)} candidates)"
-    archive = matches[0]
-    if not _is_file(archive):
+    entry = matches[0]
+    if not entry.is_file(follow_symlinks=False):
         return f"{name} (not a regular file)"
+    archive = Path(entry.path)
     sidecar = archive.with_name(f"{name}.sha256")
     if not _is_file(sidecar):
         return f"{name}.sha256 (checksum sidecar absent)"
-    collisions = _destination_collisions(dist_dir, (name, sidecar.name))
+    collisions = _destination_collisions(occupied, (name, sidecar.name))
     if collisions:
         return f"{name} (destination already occupied: {collisions})"
     return StagedArchive(name=name, archive=archive, sidecar=sidecar)
@@ -294,11 +339,11 @@ def locate_archives(
     OSError
         If the dist tree cannot be traversed or an asset cannot be probed.
     """
-    staged = [path for path in _walk_files(dist_dir) if path.parent != dist_dir]
+    staged, occupied = _walk_candidates(dist_dir, frozenset(names))
     located: list[StagedArchive] = []
     missing: list[str] = []
     for name in names:
-        match _resolve_archive(dist_dir, staged, name):
+        match _resolve_archive(staged, occupied, name):
             case StagedArchive() as archive:
                 located.append(archive)
             case str(problem):
@@ -66,6 +66,35 @@ def test_checker_boundaries_ignores_exclusions(
     assert actual == expected, "phrase boundaries or policy exclusions changed"
 
 
+def test_checker_honours_component_path_and_glob_exclusions(
+    modules: tuple[types.ModuleType, types.ModuleType],
+    tmp_path: Path,
+) -> None:
+    """Component names, path suffixes, and globs each exclude their files."""
+    rollout, check = modules
+    initialize(
+        tmp_path,
+        {
+            "keep.md": f"{PROHIBITED}\n",
+            "nested/vendor/copy.md": f"{PROHIBITED}\n",
+            "docs/skip.md": f"{PROHIBITED}\n",
+            "docs/keep.md": f"{PROHIBITED}\n",
+            "generated/out.md": f"{PROHIBITED}\n",
+        },
+    )
+    policy = rollout.Dictionary(
+        phrase_corrections=((PROHIBITED, "handwritten"),),
+        excluded_files=("vendor", "docs/skip.md", "generated/*.md"),
+    )
+
+    actual = [
+        finding.path for finding in check.check_phrase_corrections(tmp_path, policy)
+    ]
+    expected = [Path("docs/keep.md"), Path("keep.md")]
+
+    assert actual == expected, "a component, path, or glob exclusion was ignored"
+
+
 def test_checker_orders_complete_findings_by_path_phrase_and_source(
     modules: tuple[types.ModuleType, types.ModuleType],
     tmp_path: Path,
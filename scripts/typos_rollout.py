@@ -46,7 +46,7 @@ SUFFIX_PAIRS = (
 )
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class Dictionary:
     """Curated words and exclusions used to generate a ``typos`` config."""
 
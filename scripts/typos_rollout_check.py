@@ -19,9 +19,10 @@ import typos_rollout as rollout
 
 
 POLICY_PATHS = frozenset({Path(".typos-oxendict-base.toml"), Path("typos.local.toml")})
+GLOB_MAGIC = frozenset("*?[")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhraseFinding:
     """Describe one prohibited phrase in tracked text.
 
@@ -73,27 +74,108 @@ def _tracked(repository: Path) -> tuple[Path, ...]:
     return tuple(Path(item) for item in sorted(filter(None, raw.split("\0"))))
 
 
-def _excluded(path: Path, dictionary: rollout.Dictionary) -> bool:
+@dataclass(frozen=True, slots=True)
+class _CompiledPolicy:
+    """Hold the spelling policy's expressions, compiled once per scan.
+
+    Attributes
+    ----------
+    ignored
+        Compiled expressions describing ignored spans.
+    phrases
+        Compiled boundary-aware phrase expressions paired with corrections.
+    excluded
+        Every path exclusion, tested against each tracked path's components.
+    excluded_patterns
+        Exclusions that still need ``Path.match``: globs and multi-component
+        paths. A plain component name is fully decided by ``excluded``.
+    """
+
+    ignored: tuple[re.Pattern[str], ...]
+    phrases: tuple[tuple[re.Pattern[str], str], ...]
+    excluded: frozenset[str]
+    excluded_patterns: tuple[str, ...]
+
+
+def _is_component_name(item: str) -> bool:
+    """Return whether an exclusion is one literal path component.
+
+    ``Path.match`` on such an item only compares the final component, which
+    the component-membership test already covers.
+
+    Parameters
+    ----------
+    item
+        Path exclusion from the spelling policy.
+
+    Returns
+    -------
+    bool
+        ``True`` when ``item`` has no glob characters and is a single,
+        non-empty path component.
+    """
+    return GLOB_MAGIC.isdisjoint(item) and Path(item).parts == (item,)
+
+
+def _compile_policy(dictionary: rollout.Dictionary) -> _CompiledPolicy:
+    """Compile the ignore, phrase, and exclusion policy shared by every file.
+
+    Parameters
+    ----------
+    dictionary
+        Merged spelling policy containing phrase corrections, ignored spans,
+        and path exclusions.
+
+    Returns
+    -------
+    _CompiledPolicy
+        Expressions ready to apply to each tracked file without recompiling.
+
+    Raises
+    ------
+    re.error
+        If an ignore pattern is not a valid regular expression.
+    """
+    return _CompiledPolicy(
+        ignored=tuple(re.compile(pattern) for pattern in dictionary.ignore_patterns),
+        phrases=tuple(
+            (
+                re.compile(
+                    rf"(?<![\w-]){re.escape(phrase)}(?![\w-])",
+                    re.IGNORECASE,
+                ),
+                correction,
+            )
+            for phrase, correction in dictionary.phrase_corrections
+        ),
+        excluded=frozenset(dictionary.excluded_files),
+        excluded_patterns=tuple(
+            item for item in dictionary.excluded_files if not _is_component_name(item)
+        ),
+    )
+
+
+def _excluded(path: Path, compiled: _CompiledPolicy) -> bool:
     """Return whether the spelling policy excludes a tracked path.
 
     Parameters
     ----------
     path
         Repository-relative path to classify.
-    dictionary
-        Merged spelling policy containing path exclusions.
+    compiled
+        Compiled spelling policy containing path exclusions.
 
     Returns
     -------
     bool
         ``True`` when any policy exclusion matches the path.
     """
-    return any(
-        item in path.parts or path.match(item) for item in dictionary.excluded_files
+    return not compiled.excluded.isdisjoint(path.parts) or any(
+        path.match(item) for item in compiled.excluded_patterns
     )
 
 
-def _masked(text: str, patterns: tuple[str, ...]) -> str:
+def _masked(text: str, patterns: tuple[re.Pattern[str], ...]) -> str:
     """Replace ignored spans with position-preserving whitespace.
 
     Parameters
@@ -101,17 +183,12 @@ def _masked(text: str, patterns: tuple[str, ...]) -> str:
     text
         UTF-8 text to scan.
     patterns
-        Regular expressions describing ignored spans.
+        Compiled expressions describing ignored spans.
 
     Returns
     -------
     str
         Text with ignored characters blanked while preserving newlines.
-
-    Raises
-    ------
-    re.error
-        If an ignore pattern is not a valid regular expression.
     """
 
     def blank(match: re.Match[str]) -> str:
@@ -119,7 +196,7 @@ def _masked(text: str, patterns: tuple[str, ...]) -> str:
         return "".join("\n" if c == "\n" else " " for c in match.group())
 
     for pattern in patterns:
-        text = re.sub(pattern, blank, text)
+        text = pattern.sub(blank, text)
     return text
 
 
@@ -127,16 +204,12 @@ def _phrase_findings(
     path: Path,
     text: str,
     masked: str,
-    policy: tuple[str, str],
+    policy: tuple[re.Pattern[str], str],
 ) -> tuple[PhraseFinding, ...]:
     """Find one prohibited phrase in position-preserving masked text."""
-    phrase, correction = policy
+    expression, correction = policy
     found = []
-    for match in re.finditer(
-        rf"(?<![\w-]){re.escape(phrase)}(?![\w-])",
-        masked,
-        re.IGNORECASE,
-    ):
+    for match in expression.finditer(masked):
         previous = masked.rfind("\n", 0, match.start())
         found.append(
             PhraseFinding(
@@ -153,19 +226,19 @@ def _phrase_findings(
 def _file_findings(
     repository: Path,
     relative: Path,
-    dictionary: rollout.Dictionary,
+    compiled: _CompiledPolicy,
 ) -> tuple[PhraseFinding, ...]:
     """Find all prohibited phrases in one eligible tracked UTF-8 file."""
-    if relative in POLICY_PATHS or _excluded(relative, dictionary):
+    if relative in POLICY_PATHS or _excluded(relative, compiled):
         return ()
     try:
         text = (repository / relative).read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
         return ()
-    masked = _masked(text, dictionary.ignore_patterns)
+    masked = _masked(text, compiled.ignored)
     return tuple(
         finding
-        for policy in dictionary.phrase_corrections
+        for policy in compiled.phrases
         for finding in _phrase_findings(
             relative,
             text,
@@ -201,10 +274,11 @@ def check_phrase_corrections(
     >>> check_phrase_corrections(Path.cwd(), rollout.Dictionary())
     ()
     """
+    compiled = _compile_policy(dictionary)
     return tuple(
         finding
         for relative in _tracked(repository)
-        for finding in _file_findings(repository, relative, dictionary)
+        for finding in _file_findings(repository, relative, compiled)
     )
 
 
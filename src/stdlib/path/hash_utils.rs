@@ -19,6 +19,14 @@ use crate::hex::to_lower_hex;
 use crate::localization::{self, keys};
 use crate::stdlib::io_helpers::io_to_error;
 
+/// Size of the read buffer that feeds the hasher.
+///
+/// Hashed inputs are often multi-megabyte build outputs, so a 64 KiB buffer
+/// keeps the digest running in long bursts and cuts `read` calls eightfold
+/// compared with an 8 KiB one. That is too large for the stack, so each call
+/// allocates the buffer once on the heap and reuses it for every read.
+const HASH_BUFFER_SIZE: usize = 64 * 1024;
+
 pub(super) fn compute_hash(path: &Utf8Path, alg: &str) -> Result<String, Error> {
     if alg.eq_ignore_ascii_case("sha256") {
         hash_stream::<Sha256>(path)
@@ -77,7 +85,7 @@ where
 {
     let mut file = fs_utils::open_file(path)?;
     let mut hasher = H::new();
-    let mut buffer = [0_u8; 8192];
+    let mut buffer = vec![0_u8; HASH_BUFFER_SIZE];
     loop {
         let read = file.read(&mut buffer).map_err(|err| {
             io_to_error(
@@ -100,7 +108,7 @@ where
                 capacity = buffer.len(),
                 "Read reported more bytes than the buffer holds; clamping to full buffer"
             );
-            &buffer
+            buffer.as_slice()
         };
         hasher.update(chunk);
     }
@@ -111,7 +119,7 @@ where
 mod tests {
     //! Tests for the chunked digest-streaming loop.
     //!
-    //! `hash_stream` feeds the hasher from a fixed 8192-byte buffer because the
+    //! `hash_stream` feeds the hasher from a fixed-size buffer because the
     //! `RustCrypto` 0.11 hashers no longer implement `io::Write`, so `io::copy`
     //! is unavailable. The loop is the part that could silently drop, reorder,
     //! or double-count a chunk, and only inputs larger than the buffer exercise
@@ -124,7 +132,7 @@ mod tests {
     use sha2::{Digest, Sha256};
     use tempfile::TempDir;
 
-    use super::{compute_hash, to_lower_hex};
+    use super::{HASH_BUFFER_SIZE, compute_hash, to_lower_hex};
 
     /// Name of the fixture file staged inside the temporary directory.
     const FIXTURE_NAME: &str = "payload";
@@ -156,9 +164,9 @@ mod tests {
     #[rstest]
     #[case::empty(0)]
     #[case::single_read(4)]
-    #[case::exactly_one_buffer(8192)]
-    #[case::spans_two_reads(8193)]
-    #[case::spans_several_reads(70_000)]
+    #[case::exactly_one_buffer(HASH_BUFFER_SIZE)]
+    #[case::spans_two_reads(HASH_BUFFER_SIZE + 1)]
+    #[case::spans_several_reads(4 * HASH_BUFFER_SIZE + 1_234)]
     fn streamed_digest_matches_a_one_shot_digest(#[case] size: usize) -> Result<()> {
         let payload = patterned(size);
         let (_dir, file) = fixture(&payload)?;
@@ -193,26 +201,33 @@ mod tests {
     mod properties {
         //! Property tests for the chunked streaming loop.
         //!
-        //! The cases above pin sizes chosen to straddle the 8192-byte read
-        //! buffer. They cannot cover how the loop behaves at an arbitrary
-        //! offset within a chunk, which is where a partial final read or a
-        //! mishandled boundary would hide. Generating the length instead lets
-        //! the partition vary freely, including the awkward remainders either
-        //! side of a buffer boundary.
+        //! The cases above pin sizes chosen to straddle the read buffer. They
+        //! cannot cover how the loop behaves at an arbitrary offset within a
+        //! chunk, which is where a partial final read or a mishandled boundary
+        //! would hide. Generating the length instead lets the partition vary
+        //! freely, including the awkward remainders either side of a buffer
+        //! boundary.
 
         use proptest::prelude::*;
         use sha2::{Digest, Sha256};
 
-        use super::{compute_hash, fixture, to_lower_hex};
+        use super::{HASH_BUFFER_SIZE, compute_hash, fixture, to_lower_hex};
 
         proptest! {
+            // Payloads run to several buffer fills, so keep the case count
+            // modest to bound both run time and shrinking.
+            #![proptest_config(ProptestConfig {
+                cases: 32,
+                .. ProptestConfig::default()
+            })]
+
             /// Streaming a payload of any length agrees with a one-shot digest.
             ///
             /// The range spans several buffer fills so the generated lengths
             /// exercise both exact multiples and partial trailing reads.
             #[test]
             fn streamed_digest_matches_a_one_shot_digest_for_any_length(
-                payload in prop::collection::vec(any::<u8>(), 0..20_000),
+                payload in prop::collection::vec(any::<u8>(), 0..3 * HASH_BUFFER_SIZE),
             ) {
                 let (_dir, file) = fixture(&payload).expect("stage the payload");
 